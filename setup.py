@@ -22,6 +22,7 @@ setup(name='pipelinewise-tap-mysql',
           'pipelinewise-singer-python==1.*',
           'PyMySQL==1.0.2',
           'mysql-replication==0.30',
+          'orjson==3.9.7',
           'plpygis==0.2.0',
           'tzlocal==2.1',
       ],
@@ -3,7 +3,7 @@ import copy
 import pymysql
 import singer
 
-from typing import Dict
+from typing import Dict, Optional
 from singer import metadata, get_logger
 from singer import metrics
 from singer.catalog import Catalog
@@ -204,12 +204,8 @@ def do_sync_incremental(mysql_conn, catalog_entry, state, columns):
 
 
 # pylint: disable=too-many-arguments
-def do_sync_historical_binlog(mysql_conn, catalog_entry, state, columns, use_gtid: bool, engine: str):
-    binlog.verify_binlog_config(mysql_conn)
-
-    if use_gtid and engine == MYSQL_ENGINE:
-        binlog.verify_gtid_config(mysql_conn)
-
+def do_sync_historical_binlog(mysql_conn, catalog_entry, state, columns, use_gtid: bool, engine: str,
+                              gtid_server: Optional[str] = None):
     is_view = common.get_is_view(catalog_entry)
 
     if is_view:
@@ -252,7 +248,7 @@ def do_sync_historical_binlog(mysql_conn, catalog_entry, state, columns, use_gti
 
         current_gtid = None
         if use_gtid:
-            current_gtid = binlog.fetch_current_gtid_pos(mysql_conn, engine)
+            current_gtid = binlog.fetch_current_gtid_pos(mysql_conn, engine, gtid_server)
 
         state = singer.write_bookmark(state,
                                       catalog_entry.tap_stream_id,
@@ -319,7 +315,19 @@ def do_sync_full_table(mysql_conn, catalog_entry, state, columns):
     singer.write_message(singer.StateMessage(value=copy.deepcopy(state)))
 
 
+def verify_log_based_config(mysql_conn, use_gtid: bool, engine: str):
+    binlog.verify_binlog_config(mysql_conn)
+
+    if use_gtid and engine == MYSQL_ENGINE:
+        binlog.verify_gtid_config(mysql_conn)
+
+
 def sync_non_binlog_streams(mysql_conn, non_binlog_catalog, state, use_gtid, engine):
+    # the server's binlog config and the ID its GTIDs refer to it by don't change during a run, they're only verified
+    # and looked up before the first LOG_BASED stream
+    binlog_config_verified = False
+    gtid_server = None
+
     for catalog_entry in non_binlog_catalog.streams:
         columns = list(catalog_entry.schema.properties.keys())
 
@@ -347,7 +355,14 @@ def sync_non_binlog_streams(mysql_conn, non_binlog_catalog, state, use_gtid, eng
             if replication_method == 'INCREMENTAL':
                 do_sync_incremental(mysql_conn, catalog_entry, state, columns)
             elif replication_method == 'LOG_BASED':
-                do_sync_historical_binlog(mysql_conn, catalog_entry, state, columns, use_gtid, engine)
+                if not binlog_config_verified:
+                    verify_log_based_config(mysql_conn, use_gtid, engine)
+                    binlog_config_verified = True
+
+                    if use_gtid:
+                        gtid_server = binlog.fetch_gtid_server(mysql_conn, engine)
+
+                do_sync_historical_binlog(mysql_conn, catalog_entry, state, columns, use_gtid, engine, gtid_server)
             elif replication_method == 'FULL_TABLE':
                 do_sync_full_table(mysql_conn, catalog_entry, state, columns)
             else:
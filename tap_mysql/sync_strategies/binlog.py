@@ -1,21 +1,24 @@
 # pylint: disable=missing-function-docstring,too-many-arguments,too-many-branches
 import codecs
-import copy
 import datetime
+import decimal
 import json
+import queue
 import random
 import re
 import socket
+import sys
+import threading
+import orjson
 import pymysql.connections
 import pymysql.err
-import pytz
 import singer
 import tzlocal
 
 import tap_mysql.sync_strategies.common as common
 import tap_mysql.connection as connection
 
-from typing import Dict, Set, Union, Optional, Any, Tuple
+from typing import Dict, Set, Union, Optional, Any, Tuple, Iterator
 from plpygis import Geometry
 from pymysqlreplication import BinLogStreamReader
 from pymysqlreplication.constants import FIELD_TYPE
@@ -35,6 +38,8 @@ LOGGER = singer.get_logger('tap_mysql')
 
 SDC_DELETED_AT = "_sdc_deleted_at"
 UPDATE_BOOKMARK_PERIOD = 1000
+BINLOG_EVENTS_QUEUE_SIZE = 1024
+BINLOG_READER_JOIN_TIMEOUT = 1
 BOOKMARK_KEYS = {'log_file', 'log_pos', 'version', 'gtid'}
 
 MYSQL_TIMESTAMP_TYPES = {
@@ -111,9 +116,25 @@ def fetch_current_log_file_and_pos(mysql_conn):
             return current_log_file, current_log_pos
 
 
+def fetch_gtid_server(mysql_conn: MySQLConnection, engine: str) -> str:
+    """
+    Finds the ID the given server's GTIDs refer to it by, the server ID on MariaDB and the server UUID on MySQL
+    Args:
+        mysql_conn: Mysql connection instance
+        engine: DB engine (mariadb/mysql)
+
+    Returns: server ID or UUID
+    """
+    if engine == connection.MARIADB_ENGINE:
+        return str(connection.fetch_server_id(mysql_conn))
+
+    return connection.fetch_server_uuid(mysql_conn)
+
+
 def fetch_current_gtid_pos(
         mysql_conn: MySQLConnection,
-        engine: str
+        engine: str,
+        server: Optional[str] = None
 ) -> str:
     """
     Find the given server's current GTID position.
@@ -124,14 +145,13 @@ def fetch_current_gtid_pos(
     Args:
         mysql_conn: Mysql connection instance
         engine: DB engine (mariadb/mysql)
+        server: server ID or UUID as returned by fetch_gtid_server, looked up if not given
 
     Returns: Gtid position if found, otherwise raises exception
     """
 
-    if engine == connection.MARIADB_ENGINE:
-        server = str(connection.fetch_server_id(mysql_conn))
-    else:
-        server = connection.fetch_server_uuid(mysql_conn)
+    if server is None:
+        server = fetch_gtid_server(mysql_conn, engine)
 
     with connect_with_backoff(mysql_conn) as open_conn:
         with open_conn.cursor() as cur:
@@ -190,13 +210,17 @@ def json_bytes_to_string(data):
 
 
 # pylint: disable=too-many-locals
-def row_to_singer_record(catalog_entry, version, db_column_map, row, time_extracted):
+def row_to_singer_record(catalog_entry, version, event_columns, row, time_extracted):
     row_to_persist = {}
 
     for column_name, val in row.items():
-        property_type = catalog_entry.schema.properties[column_name].type
-        property_format = catalog_entry.schema.properties[column_name].format
-        db_column_type = db_column_map.get(column_name)
+        # only keep the stream's desired columns, filtering here saves building a filtered copy of every row
+        event_column = event_columns.get(column_name)
+
+        if event_column is None:
+            continue
+
+        property_format, property_is_boolean, db_column_type = event_column
 
         if isinstance(val, datetime.datetime):
             if db_column_type in MYSQL_TIMESTAMP_TYPES:
@@ -206,7 +230,7 @@ def row_to_singer_record(catalog_entry, version, db_column_map, row, time_extrac
                 # -L145
                 timezone = tzlocal.get_localzone()
                 local_datetime = timezone.localize(val)
-                utc_datetime = local_datetime.astimezone(pytz.UTC)
+                utc_datetime = local_datetime.astimezone(datetime.timezone.utc)
                 row_to_persist[column_name] = utc_datetime.isoformat()
             else:
                 row_to_persist[column_name] = val.isoformat() + '+00:00'
@@ -219,7 +243,7 @@ def row_to_singer_record(catalog_entry, version, db_column_map, row, time_extrac
                 # this should convert time column into 'HH:MM:SS' formatted string
                 row_to_persist[column_name] = str(val)
             else:
-                timedelta_from_epoch = datetime.datetime.utcfromtimestamp(0) + val
+                timedelta_from_epoch = common.EPOCH + val
                 row_to_persist[column_name] = timedelta_from_epoch.isoformat() + '+00:00'
 
         elif db_column_type == FIELD_TYPE.JSON:
@@ -237,7 +261,7 @@ def row_to_singer_record(catalog_entry, version, db_column_map, row, time_extrac
             # encode bytes as hex bytes then to utf8 string
             row_to_persist[column_name] = codecs.encode(val, 'hex').decode('utf-8')
 
-        elif 'boolean' in property_type or property_type == 'boolean':
+        elif property_is_boolean:
             if val is None:
                 boolean_representation = None
             elif val == 0:
@@ -258,6 +282,44 @@ def row_to_singer_record(catalog_entry, version, db_column_map, row, time_extrac
         time_extracted=time_extracted)
 
 
+def _orjson_default(value: Any) -> orjson.Fragment:
+    # decimals are written as exact JSON numbers, the same as singer does
+    if isinstance(value, decimal.Decimal):
+        return orjson.Fragment(str(value))
+
+    raise TypeError
+
+
+def write_record_message(record_message: singer.RecordMessage) -> None:
+    """
+    Writes a record message to stdout without flushing it.
+
+    singer.write_message flushes stdout after every message, which costs a write syscall per row. Records are
+    instead left in the stdout buffer and go out when it fills up or when the next STATE or SCHEMA message is
+    written, so a state bookmark is never flushed ahead of the records it covers.
+
+    Records are serialized with orjson to UTF-8 and written to the binary buffer underneath stdout, so non-ASCII
+    text doesn't depend on stdout's encoding. This keeps the order of messages as every other message is written
+    with singer.write_message, which leaves nothing behind in the text layer. Values orjson doesn't support, and
+    stdout replacements without a binary buffer, fall back to singer's ASCII only serializer.
+
+    Args:
+        record_message: the record to write
+    """
+    stdout_buffer = getattr(sys.stdout, 'buffer', None)
+
+    if stdout_buffer is None:
+        sys.stdout.write(singer.format_message(record_message) + '\n')
+        return
+
+    try:
+        data = orjson.dumps(record_message.asdict(), default=_orjson_default, option=orjson.OPT_APPEND_NEWLINE)
+    except TypeError:
+        data = (singer.format_message(record_message) + '\n').encode('utf-8')
+
+    stdout_buffer.write(data)
+
+
 def calculate_gtid_bookmark(
         mysql_conn: MySQLConnection,
         binlog_streams_map: Dict[str, Any],
@@ -395,29 +457,45 @@ def get_min_log_pos_per_log_file(binlog_streams_map, state) -> Dict[str, Dict]:
     return min_log_pos_per_file
 
 
+def binary_log_exists(cursor, log_file: str) -> bool:
+    """
+    Checks if the given binary log is still on the server by reading its first event, which unlike SHOW BINARY LOGS
+    doesn't list and size every binary log the server retains.
+
+    Args:
+        cursor: cursor of an open connection
+        log_file: binary log file name
+
+    Returns: True if the binary log exists, False otherwise
+    """
+    try:
+        cursor.execute('SHOW BINLOG EVENTS IN %s LIMIT 1', (log_file,))
+    except pymysql.err.OperationalError as ex:
+        # Error when executing command SHOW BINLOG EVENTS: Could not find target log
+        if ex.args[0] == 1220:
+            return False
+        raise
+
+    return True
+
+
 def calculate_bookmark(mysql_conn, binlog_streams_map, state) -> Tuple[str, int]:
     min_log_pos_per_file = get_min_log_pos_per_log_file(binlog_streams_map, state)
+    state_logs = sorted(log_file for log_file in min_log_pos_per_file if log_file)
+
+    if not state_logs:
+        raise Exception("Unable to replicate binlog stream because no binary log file and position are bookmarked "
+                        "for the selected streams.")
 
     with connect_with_backoff(mysql_conn) as open_conn:
         with open_conn.cursor() as cur:
-            cur.execute("SHOW BINARY LOGS")
-
-            binary_logs = cur.fetchall()
+            expired_logs = [log_file for log_file in state_logs if not binary_log_exists(cur, log_file)]
 
-            if binary_logs:
-                server_logs_set = {log[0] for log in binary_logs}
-                state_logs_set = set(min_log_pos_per_file.keys())
-                expired_logs = state_logs_set.difference(server_logs_set)
+    if expired_logs:
+        raise Exception('Unable to replicate binlog stream because the following binary log(s) no longer '
+                        f'exist: {", ".join(expired_logs)}')
 
-                if expired_logs:
-                    raise Exception('Unable to replicate binlog stream because the following binary log(s) no longer '
-                                    f'exist: {", ".join(expired_logs)}')
-
-                for log_file in sorted(server_logs_set):
-                    if min_log_pos_per_file.get(log_file):
-                        return log_file, min_log_pos_per_file[log_file]['log_pos']
-
-            raise Exception("Unable to replicate binlog stream because no binary logs exist on the server.")
+    return state_logs[0], min_log_pos_per_file[state_logs[0]]['log_pos']
 
 
 def update_bookmarks(
@@ -464,25 +542,47 @@ def update_bookmarks(
     return state
 
 
-def get_db_column_types(event):
-    return {c.name: c.type for c in event.columns}
+def get_event_columns(event, catalog_entry, columns) -> Dict[str, Tuple[Optional[str], bool, int]]:
+    """
+    Resolves, for each of the event's desired columns, what converting its values depends on. All rows of an event
+    share the same columns, so this is done once per event rather than for every value.
+
+    Args:
+        event: rows event
+        catalog_entry: the stream's catalog entry
+        columns: the stream's desired columns
+
+    Returns: dictionary of the event's desired column names to their property format, whether the property is a
+        boolean and their db column type
+    """
+    event_columns = {}
+
+    for column in event.columns:
+        if column.name in columns:
+            property_schema = catalog_entry.schema.properties[column.name]
+            property_type = property_schema.type
+
+            event_columns[column.name] = (
+                property_schema.format,
+                'boolean' in property_type or property_type == 'boolean',
+                column.type
+            )
+
+    return event_columns
 
 
 def handle_write_rows_event(event, catalog_entry, state, columns, rows_saved, time_extracted):
     stream_version = common.get_stream_version(catalog_entry.tap_stream_id, state)
-    db_column_types = get_db_column_types(event)
+    event_columns = get_event_columns(event, catalog_entry, columns)
 
     for row in event.rows:
-        filtered_vals = {k: v for k, v in row['values'].items()
-                         if k in columns}
-
         record_message = row_to_singer_record(catalog_entry,
                                               stream_version,
-                                              db_column_types,
-                                              filtered_vals,
+                                              event_columns,
+                                              row['values'],
                                               time_extracted)
 
-        singer.write_message(record_message)
+        write_record_message(record_message)
         rows_saved += 1
 
     return rows_saved
@@ -490,19 +590,16 @@ def handle_write_rows_event(event, catalog_entry, state, columns, rows_saved, ti
 
 def handle_update_rows_event(event, catalog_entry, state, columns, rows_saved, time_extracted):
     stream_version = common.get_stream_version(catalog_entry.tap_stream_id, state)
-    db_column_types = get_db_column_types(event)
+    event_columns = get_event_columns(event, catalog_entry, columns)
 
     for row in event.rows:
-        filtered_vals = {k: v for k, v in row['after_values'].items()
-                         if k in columns}
-
         record_message = row_to_singer_record(catalog_entry,
                                               stream_version,
-                                              db_column_types,
-                                              filtered_vals,
+                                              event_columns,
+                                              row['after_values'],
                                               time_extracted)
 
-        singer.write_message(record_message)
+        write_record_message(record_message)
 
         rows_saved += 1
 
@@ -511,31 +608,36 @@ def handle_update_rows_event(event, catalog_entry, state, columns, rows_saved, t
 
 def handle_delete_rows_event(event, catalog_entry, state, columns, rows_saved, time_extracted):
     stream_version = common.get_stream_version(catalog_entry.tap_stream_id, state)
-    db_column_types = get_db_column_types(event)
+    event_columns = get_event_columns(event, catalog_entry, columns)
 
-    event_ts = datetime.datetime.utcfromtimestamp(event.timestamp) \
-        .replace(tzinfo=pytz.UTC).isoformat()
+    # all rows of the event share its timestamp, format it once and set it on the records as is rather than
+    # converting a datetime for every row
+    event_ts = datetime.datetime.fromtimestamp(event.timestamp, tz=datetime.timezone.utc).isoformat()
 
     for row in event.rows:
-        vals = row['values']
-        vals[SDC_DELETED_AT] = event_ts
-
-        filtered_vals = {k: v for k, v in vals.items()
-                         if k in columns}
-
         record_message = row_to_singer_record(catalog_entry,
                                               stream_version,
-                                              db_column_types,
-                                              filtered_vals,
+                                              event_columns,
+                                              row['values'],
                                               time_extracted)
 
-        singer.write_message(record_message)
+        if SDC_DELETED_AT in columns:
+            record_message.record[SDC_DELETED_AT] = event_ts
+
+        write_record_message(record_message)
 
         rows_saved += 1
 
     return rows_saved
 
 
+ROWS_EVENT_HANDLERS = {
+    WriteRowsEvent: handle_write_rows_event,
+    UpdateRowsEvent: handle_update_rows_event,
+    DeleteRowsEvent: handle_delete_rows_event,
+}
+
+
 def generate_streams_map(binlog_streams):
     stream_map = {}
 
@@ -543,9 +645,10 @@ def generate_streams_map(binlog_streams):
         columns = add_automatic_properties(catalog_entry,
                                            list(catalog_entry.schema.properties.keys()))
 
+        # desired columns are only ever used for membership tests against every row's values
         stream_map[catalog_entry.tap_stream_id] = {
             'catalog_entry': catalog_entry,
-            'desired_columns': columns
+            'desired_columns': set(columns)
         }
 
     return stream_map
@@ -581,6 +684,85 @@ def __get_diff_in_columns_list(
     return set(binlog_columns_filtered).difference(schema_properties)
 
 
+def _read_binlog_in_background(reader: BinLogStreamReader) -> Iterator[Tuple[Any, str, int]]:
+    """
+    Consumes the binlog stream reader in a background thread, so fetching and parsing the next events from the
+    server overlaps with syncing the current ones. Events are handed over through a bounded queue, in order.
+
+    The background thread owns the reader and closes it once it stops reading, the caller must not use or close the
+    reader after passing it in. The generator must be closed once no more events are needed, this stops the
+    background thread. The thread may be blocked reading from a server that never sends EOF though, so it's only
+    waited for up to BINLOG_READER_JOIN_TIMEOUT seconds and left behind as a daemon thread after that, still
+    holding the reader.
+
+    Args:
+        reader: binlog stream reader to consume
+
+    Returns: generator of tuples of binlog event, reader's binlog file and reader's binlog position after the event
+    """
+    events_queue = queue.Queue(maxsize=BINLOG_EVENTS_QUEUE_SIZE)
+    stop_reading = threading.Event()
+    end_of_stream = object()
+
+    def enqueue(item) -> bool:
+        # the consumer may stop at any time, so don't block on a full queue forever
+        while not stop_reading.is_set():
+            try:
+                events_queue.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                pass
+
+        return False
+
+    def read_events():
+        try:
+            for binlog_event in reader:
+                if isinstance(binlog_event, (MariadbGtidEvent, GtidEvent)):
+                    # There is strange behavior happening when using GTID in the pymysqlreplication lib,
+                    # explained here: https://github.com/noplay/python-mysql-replication/issues/367
+                    # Fix: Updating the reader's auto-position to the newly encountered gtid means we won't have to
+                    # restart consuming binlog from old GTID pos when connection to server is lost.
+                    reader.auto_position = binlog_event.gtid
+
+                # the reader's position moves on with every event read, so it's captured along with the event
+                if not enqueue((binlog_event, reader.log_file, reader.log_pos)):
+                    return
+
+            enqueue(end_of_stream)
+
+        except Exception as ex:  # pylint: disable=broad-except
+            # re-raised in the consuming thread
+            enqueue(ex)
+
+        finally:
+            # closing the reader from another thread while this one is still reading would make the reader reconnect
+            reader.close()
+
+    reader_thread = threading.Thread(target=read_events, name='binlog-reader', daemon=True)
+    reader_thread.start()
+
+    try:
+        while True:
+            item = events_queue.get()
+
+            if item is end_of_stream:
+                return
+
+            if isinstance(item, Exception):
+                raise item
+
+            yield item
+
+    finally:
+        stop_reading.set()
+        reader_thread.join(timeout=BINLOG_READER_JOIN_TIMEOUT)
+
+        if reader_thread.is_alive():
+            LOGGER.warning('BinLog reader is still waiting for the server, leaving it to close the reader once it '
+                           'stops reading')
+
+
 # pylint: disable=R1702,R0915
 def _run_binlog_sync(
         mysql_conn: MySQLConnection,
@@ -592,7 +774,14 @@ def _run_binlog_sync(
         end_log_pos: int):
 
     processed_rows_events = 0
-    events_skipped = 0
+
+    # Counter as it was when the last STATE message was sent. Events can carry many rows, so the counter rarely
+    # lands exactly on a multiple of UPDATE_BOOKMARK_PERIOD, and when it does it can sit there for many events;
+    # comparing against the last flush sends exactly one STATE message per period.
+    rows_at_last_state = 0
+
+    # binlog position the last STATE message was sent for, there is no point sending the same bookmarks again
+    position_at_last_state = None
 
     log_file = None
     log_pos = None
@@ -602,173 +791,151 @@ def _run_binlog_sync(
     # Saving them here to avoid doing the check if we should ignore a column over and over again
     ignored_columns = set()
 
-    # Exit from the loop when the reader either runs out of streams to return or we reach
-    # the end position (which is Master's)
-    for binlog_event in reader:
-
-        # get reader current binlog file and position
-        log_file = reader.log_file
-        log_pos = reader.log_pos
-
-        # The iterator across python-mysql-replication's fetchone method should ultimately terminate
-        # upon receiving an EOF packet. There seem to be some cases when a MySQL server will not send
-        # one causing binlog replication to hang.
-        if (log_file > end_log_file) or (end_log_file == log_file and log_pos >= end_log_pos):
-            LOGGER.info('BinLog reader (file: %s, pos:%s) has reached or exceeded end position, exiting!',
-                        log_file,
-                        log_pos)
-
-            # There are cases when a mass operation (inserts, updates, deletes) starts right after we get the Master
-            # binlog file and position above, making the latter behind the stream reader and it causes some data loss
-            # in the next run by skipping everything between end_log_file and log_pos
-            # so we need to update log_pos back to master's position
-            log_file = end_log_file
-            log_pos = end_log_pos
+    binlog_events = _read_binlog_in_background(reader)
 
-            break
+    try:
+        # Exit from the loop when the reader either runs out of streams to return or we reach
+        # the end position (which is Master's)
+        for binlog_event, log_file, log_pos in binlog_events:
+            # The iterator across python-mysql-replication's fetchone method should ultimately terminate
+            # upon receiving an EOF packet. There seem to be some cases when a MySQL server will not send
+            # one causing binlog replication to hang.
+            if (log_file > end_log_file) or (end_log_file == log_file and log_pos >= end_log_pos):
+                LOGGER.info('BinLog reader (file: %s, pos:%s) has reached or exceeded end position, exiting!',
+                            log_file,
+                            log_pos)
+
+                # There are cases when a mass operation (inserts, updates, deletes) starts right after we get the Master
+                # binlog file and position above, making the latter behind the stream reader and it causes some data loss
+                # in the next run by skipping everything between end_log_file and log_pos
+                # so we need to update log_pos back to master's position
+                log_file = end_log_file
+                log_pos = end_log_pos
+
+                break
+
+            if isinstance(binlog_event, RotateEvent):
+                LOGGER.debug('RotateEvent: log_file=%s, log_pos=%d',
+                             binlog_event.next_binlog,
+                             binlog_event.position)
+
+                # the reader has moved to the new log file and position already, they get written to the bookmarks
+                # along with the next STATE message like any other position
+
+            elif isinstance(binlog_event, MariadbGtidEvent) or isinstance(binlog_event, GtidEvent):
+                gtid_pos = binlog_event.gtid
+
+                LOGGER.debug('%s: gtid=%s',
+                             binlog_event.__class__.__name__,
+                             gtid_pos)
 
-        if isinstance(binlog_event, RotateEvent):
-            LOGGER.debug('RotateEvent: log_file=%s, log_pos=%d',
-                         binlog_event.next_binlog,
-                         binlog_event.position)
+            else:
+                time_extracted = utils.now()
 
-            state = update_bookmarks(state,
-                                     binlog_streams_map,
-                                     binlog_event.next_binlog,
-                                     binlog_event.position,
-                                     gtid_pos
-                                     )
+                tap_stream_id = common.generate_tap_stream_id(binlog_event.schema, binlog_event.table)
+                streams_map_entry = binlog_streams_map.get(tap_stream_id, {})
+                catalog_entry = streams_map_entry.get('catalog_entry')
+                columns = streams_map_entry.get('desired_columns')
 
-        elif isinstance(binlog_event, MariadbGtidEvent) or isinstance(binlog_event, GtidEvent):
-            gtid_pos = binlog_event.gtid
+                # The reader matches schema and table names separately, so events of a table named like a selected
+                # table of another selected schema still get here and are skipped
+                if catalog_entry:
+                    # Compare event's columns to the schema properties
+                    diff = __get_diff_in_columns_list(binlog_event,
+                                                      catalog_entry.schema.properties.keys(),
+                                                      ignored_columns)
 
-            LOGGER.debug('%s: gtid=%s',
-                         binlog_event.__class__.__name__,
-                         gtid_pos)
+                    # If there are additional cols in the event then run discovery if needed and update the catalog
+                    if diff:
 
-            state = update_bookmarks(state,
-                                     binlog_streams_map,
-                                     log_file,
-                                     log_pos,
-                                     gtid_pos
-                                     )
+                        LOGGER.info('Stream `%s`: Difference detected between event and schema: %s', tap_stream_id, diff)
 
-            # There is strange behavior happening when using GTID in the pymysqlreplication lib,
-            # explained here: https://github.com/noplay/python-mysql-replication/issues/367
-            # Fix: Updating the reader's auto-position to the newly encountered gtid means we won't have to restart
-            # consuming binlog from old GTID pos when connection to server is lost.
-            reader.auto_position = gtid_pos
+                        md_map = metadata.to_map(catalog_entry.metadata)
 
-        else:
-            time_extracted = utils.now()
+                        if not should_run_discovery(diff, md_map):
+                            LOGGER.info('Stream `%s`: Not running discovery. Ignoring all detected columns in %s',
+                                        tap_stream_id,
+                                        diff)
+                            ignored_columns = ignored_columns.union(diff)
 
-            tap_stream_id = common.generate_tap_stream_id(binlog_event.schema, binlog_event.table)
-            streams_map_entry = binlog_streams_map.get(tap_stream_id, {})
-            catalog_entry = streams_map_entry.get('catalog_entry')
-            columns = streams_map_entry.get('desired_columns')
+                        else:
+                            LOGGER.info('Stream `%s`: Running discovery ... ', tap_stream_id)
 
-            if not catalog_entry:
-                events_skipped += 1
+                            # run discovery for the current table only
+                            new_catalog_entry = discover_catalog(mysql_conn,
+                                                                 config.get('filter_dbs'),
+                                                                 catalog_entry.table).streams[0]
 
-                if events_skipped % UPDATE_BOOKMARK_PERIOD == 0:
-                    LOGGER.debug("Skipped %s events so far as they were not for selected tables; %s rows extracted",
-                                 events_skipped,
-                                 processed_rows_events)
-            else:
-                # Compare event's columns to the schema properties
-                diff = __get_diff_in_columns_list(binlog_event,
-                                                  catalog_entry.schema.properties.keys(),
-                                                  ignored_columns)
+                            selected = {k for k, v in new_catalog_entry.schema.properties.items()
+                                        if common.property_is_selected(new_catalog_entry, k)}
+
+                            # the new catalog has "stream" property = table name, we need to update that to make it the
+                            # same as the result of the "resolve_catalog" function
+                            new_catalog_entry.stream = tap_stream_id
+
+                            # These are the columns we need to select
+                            new_columns = desired_columns(selected, new_catalog_entry.schema)
+
+                            cols = set(new_catalog_entry.schema.properties.keys())
+
+                            # drop unsupported properties from schema
+                            for col in cols:
+                                if col not in new_columns:
+                                    new_catalog_entry.schema.properties.pop(col, None)
 
-                # If there are additional cols in the event then run discovery if needed and update the catalog
-                if diff:
+                            # Add the _sdc_deleted_at col
+                            new_columns = set(add_automatic_properties(new_catalog_entry, list(new_columns)))
 
-                    LOGGER.info('Stream `%s`: Difference detected between event and schema: %s', tap_stream_id, diff)
+                            # send the new scheme to target if we have a new schema
+                            if new_catalog_entry.schema.properties != catalog_entry.schema.properties:
+                                write_schema_message(catalog_entry=new_catalog_entry)
+                                catalog_entry = new_catalog_entry
 
-                    md_map = metadata.to_map(catalog_entry.metadata)
+                                # update this dictionary while we're at it
+                                binlog_streams_map[tap_stream_id]['catalog_entry'] = new_catalog_entry
+                                binlog_streams_map[tap_stream_id]['desired_columns'] = new_columns
+                                columns = new_columns
 
-                    if not should_run_discovery(diff, md_map):
-                        LOGGER.info('Stream `%s`: Not running discovery. Ignoring all detected columns in %s',
-                                    tap_stream_id,
-                                    diff)
-                        ignored_columns = ignored_columns.union(diff)
+                    handle_rows_event = ROWS_EVENT_HANDLERS.get(binlog_event.__class__)
 
+                    if handle_rows_event:
+                        processed_rows_events = handle_rows_event(binlog_event,
+                                                                  catalog_entry,
+                                                                  state,
+                                                                  columns,
+                                                                  processed_rows_events,
+                                                                  time_extracted)
                     else:
-                        LOGGER.info('Stream `%s`: Running discovery ... ', tap_stream_id)
-
-                        # run discovery for the current table only
-                        new_catalog_entry = discover_catalog(mysql_conn,
-                                                             config.get('filter_dbs'),
-                                                             catalog_entry.table).streams[0]
-
-                        selected = {k for k, v in new_catalog_entry.schema.properties.items()
-                                    if common.property_is_selected(new_catalog_entry, k)}
-
-                        # the new catalog has "stream" property = table name, we need to update that to make it the
-                        # same as the result of the "resolve_catalog" function
-                        new_catalog_entry.stream = tap_stream_id
-
-                        # These are the columns we need to select
-                        new_columns = desired_columns(selected, new_catalog_entry.schema)
-
-                        cols = set(new_catalog_entry.schema.properties.keys())
-
-                        # drop unsupported properties from schema
-                        for col in cols:
-                            if col not in new_columns:
-                                new_catalog_entry.schema.properties.pop(col, None)
-
-                        # Add the _sdc_deleted_at col
-                        new_columns = add_automatic_properties(new_catalog_entry, list(new_columns))
-
-                        # send the new scheme to target if we have a new schema
-                        if new_catalog_entry.schema.properties != catalog_entry.schema.properties:
-                            write_schema_message(catalog_entry=new_catalog_entry)
-                            catalog_entry = new_catalog_entry
-
-                            # update this dictionary while we're at it
-                            binlog_streams_map[tap_stream_id]['catalog_entry'] = new_catalog_entry
-                            binlog_streams_map[tap_stream_id]['desired_columns'] = new_columns
-                            columns = new_columns
-
-                if isinstance(binlog_event, WriteRowsEvent):
-                    processed_rows_events = handle_write_rows_event(binlog_event,
-                                                                    catalog_entry,
-                                                                    state,
-                                                                    columns,
-                                                                    processed_rows_events,
-                                                                    time_extracted)
-
-                elif isinstance(binlog_event, UpdateRowsEvent):
-                    processed_rows_events = handle_update_rows_event(binlog_event,
-                                                                     catalog_entry,
-                                                                     state,
-                                                                     columns,
-                                                                     processed_rows_events,
-                                                                     time_extracted)
-
-                elif isinstance(binlog_event, DeleteRowsEvent):
-                    processed_rows_events = handle_delete_rows_event(binlog_event,
-                                                                     catalog_entry,
-                                                                     state,
-                                                                     columns,
-                                                                     processed_rows_events,
-                                                                     time_extracted)
-                else:
-                    LOGGER.debug("Skipping event for table %s.%s as it is not an INSERT, UPDATE, or DELETE",
-                                 binlog_event.schema,
-                                 binlog_event.table)
-
-        # Update singer bookmark and send STATE message periodically
-        if ((processed_rows_events and processed_rows_events % UPDATE_BOOKMARK_PERIOD == 0) or
-                (events_skipped and events_skipped % UPDATE_BOOKMARK_PERIOD == 0)):
-            state = update_bookmarks(state,
-                                     binlog_streams_map,
-                                     log_file,
-                                     log_pos,
-                                     gtid_pos
-                                     )
-            singer.write_message(singer.StateMessage(value=copy.deepcopy(state)))
+                        LOGGER.debug("Skipping event for table %s.%s as it is not an INSERT, UPDATE, or DELETE",
+                                     binlog_event.schema,
+                                     binlog_event.table)
+
+            # Update singer bookmark and send STATE message periodically
+            if processed_rows_events - rows_at_last_state >= UPDATE_BOOKMARK_PERIOD:
+
+                if (log_file, log_pos, gtid_pos) != position_at_last_state:
+                    state = update_bookmarks(state,
+                                             binlog_streams_map,
+                                             log_file,
+                                             log_pos,
+                                             gtid_pos
+                                             )
+                    # write_message serializes the state straight away, there is no need to copy it
+                    singer.write_message(singer.StateMessage(value=state))
+
+                    position_at_last_state = (log_file, log_pos, gtid_pos)
+
+                rows_at_last_state = processed_rows_events
+
+        else:
+            # The reader drops the events of unselected tables, so the last event synced can be far behind the end
+            # of the binlog. Reaching EOF means everything up to Master's position has been read, so bookmark that
+            # instead of reading the same unselected events again in the next run.
+            log_file = end_log_file
+            log_pos = end_log_pos
+
+    finally:
+        binlog_events.close()
 
     LOGGER.info('Processed %s rows', processed_rows_events)
 
@@ -783,6 +950,7 @@ def _run_binlog_sync(
 
 def create_binlog_stream_reader(
         config: Dict,
+        binlog_streams_map: Dict[str, Any],
         log_file: Optional[str],
         log_pos: Optional[int],
         gtid_pos: Optional[str]
@@ -792,6 +960,7 @@ def create_binlog_stream_reader(
 
     Args:
         config: dictionary of the content of tap config.json
+        binlog_streams_map: tables to stream using binlog, the reader only decodes rows events of these tables
         log_file: binlog file name to start replication from (Optional if using gtid)
         log_pos: binlog pos to start replication from (Optional if using gtid)
         gtid_pos: GTID pos to start replication from (Optional if using log_file & pos)
@@ -816,9 +985,17 @@ def create_binlog_stream_reader(
         'only_events': [WriteRowsEvent, UpdateRowsEvent, DeleteRowsEvent],
     }
 
+    # only decode rows events of the selected tables, the reader discards the others before parsing their rows.
+    # Schema and table names are matched separately, so events of a table sharing its name with one in another
+    # selected schema still get through and are skipped when syncing.
+    schemas = {common.get_database_name(stream['catalog_entry']) for stream in binlog_streams_map.values()}
+
     # only fetch events pertaining to the schemas in filter db.
     if config.get('filter_db'):
-        kwargs['only_schemas'] = config['filter_db'].split(',')
+        schemas = schemas.intersection(config['filter_db'].split(','))
+
+    kwargs['only_schemas'] = sorted(schemas)
+    kwargs['only_tables'] = sorted({stream['catalog_entry'].table for stream in binlog_streams_map.values()})
 
     if config['use_gtid']:
 
@@ -842,6 +1019,10 @@ def create_binlog_stream_reader(
         kwargs['only_events'].append(RotateEvent)
         kwargs['log_file'] = log_file
         kwargs['log_pos'] = log_pos
+
+        # Bookmarked positions are the reader's log_pos after an event, i.e. where the next event starts, and
+        # resume_stream makes the server dump from exactly that position, so the last synced event isn't read again
+        # and there's no need for skip_to_timestamp, which would still fetch and decode every skipped event.
         kwargs['resume_stream'] = True
 
     return BinLogStreamReader(**kwargs)
@@ -871,14 +1052,13 @@ def sync_binlog_stream(
     else:
         log_file, log_pos = calculate_bookmark(mysql_conn, binlog_streams_map, state)
 
-    reader = None
-
     try:
-        reader = create_binlog_stream_reader(config, log_file, log_pos, gtid)
-
         end_log_file, end_log_pos = fetch_current_log_file_and_pos(mysql_conn)
         LOGGER.info('Current Master binlog file and pos: %s %s', end_log_file, end_log_pos)
 
+        # the reader only connects once it's read from, and it's closed by the thread reading it in the background
+        reader = create_binlog_stream_reader(config, binlog_streams_map, log_file, log_pos, gtid)
+
         _run_binlog_sync(mysql_conn, reader, binlog_streams_map, state, config, end_log_file, end_log_pos)
 
     except pymysql.err.OperationalError as ex:
@@ -889,10 +1069,4 @@ def sync_binlog_stream(
 
         raise
 
-    finally:
-        # BinLogStreamReader doesn't implement the `with` methods
-        # So, try/finally will close the chain from the top
-        if reader:
-            reader.close()
-
-    singer.write_message(singer.StateMessage(value=copy.deepcopy(state)))
+    singer.write_message(singer.StateMessage(value=state))
@@ -11,6 +11,8 @@ from tap_mysql.stream_utils import get_key_properties
 
 LOGGER = singer.get_logger('tap_mysql')
 
+EPOCH = datetime.datetime.utcfromtimestamp(0)
+
 
 def escape(string):
     if '`' in string:
@@ -90,24 +92,26 @@ def generate_select_sql(catalog_entry, columns):
 
 
 def row_to_singer_record(catalog_entry, version, row, columns, time_extracted):
-    row_to_persist = ()
-    for idx, elem in enumerate(row):
-        property_type = catalog_entry.schema.properties[columns[idx]].type
-        property_format = catalog_entry.schema.properties[columns[idx]].format
+    rec = {}
+    properties = catalog_entry.schema.properties
+
+    for column_name, elem in zip(columns, row):
+        property_schema = properties[column_name]
+        property_type = property_schema.type
+        property_format = property_schema.format
 
         if isinstance(elem, datetime.datetime):
-            row_to_persist += (elem.isoformat() + '+00:00',)
+            rec[column_name] = elem.isoformat() + '+00:00'
 
         elif isinstance(elem, datetime.date):
-            row_to_persist += (elem.isoformat() + 'T00:00:00+00:00',)
+            rec[column_name] = elem.isoformat() + 'T00:00:00+00:00'
 
         elif isinstance(elem, datetime.timedelta):
             if property_format == 'time':
-                row_to_persist += (str(elem),) # this should convert time column into 'HH:MM:SS' formatted string
+                rec[column_name] = str(elem) # this should convert time column into 'HH:MM:SS' formatted string
             else:
-                epoch = datetime.datetime.utcfromtimestamp(0)
-                timedelta_from_epoch = epoch + elem
-                row_to_persist += (timedelta_from_epoch.isoformat() + '+00:00',)
+                timedelta_from_epoch = EPOCH + elem
+                rec[column_name] = timedelta_from_epoch.isoformat() + '+00:00'
 
         elif 'boolean' in property_type or property_type == 'boolean':
             if elem is None:
@@ -116,11 +120,10 @@ def row_to_singer_record(catalog_entry, version, row, columns, time_extracted):
                 boolean_representation = False
             else:
                 boolean_representation = True
-            row_to_persist += (boolean_representation,)
+            rec[column_name] = boolean_representation
 
         else:
-            row_to_persist += (elem,)
-    rec = dict(zip(columns, row_to_persist))
+            rec[column_name] = elem
 
     return singer.RecordMessage(
         stream=catalog_entry.stream,
@@ -153,6 +156,14 @@ def sync_query(cursor, catalog_entry, state, select_sql, columns, stream_version
 
     database_name = get_database_name(catalog_entry)
 
+    # the stream's metadata doesn't change during the query, look it up once rather than for every row
+    md_map = metadata.to_map(catalog_entry.metadata)
+    replication_method = md_map.get((), {}).get('replication-method')
+    key_properties = get_key_properties(catalog_entry)
+    max_pk_values = singer.get_bookmark(state,
+                                        catalog_entry.tap_stream_id,
+                                        'max_pk_values')
+
     with metrics.record_counter(None) as counter:
         counter.tags['database'] = database_name
         counter.tags['table'] = catalog_entry.table
@@ -167,17 +178,7 @@ def sync_query(cursor, catalog_entry, state, select_sql, columns, stream_version
                                                   time_extracted)
             singer.write_message(record_message)
 
-            md_map = metadata.to_map(catalog_entry.metadata)
-            stream_metadata = md_map.get((), {})
-            replication_method = stream_metadata.get('replication-method')
-
             if replication_method in {'FULL_TABLE', 'LOG_BASED'}:
-                key_properties = get_key_properties(catalog_entry)
-
-                max_pk_values = singer.get_bookmark(state,
-                                                    catalog_entry.tap_stream_id,
-                                                    'max_pk_values')
-
                 if max_pk_values:
                     last_pk_fetched = {k:v for k, v in record_message.record.items()
                                        if k in key_properties}
@@ -4,6 +4,7 @@ import singer.metadata
 import tap_mysql
 
 from tap_mysql.connection import connect_with_backoff
+from tap_mysql.sync_strategies import binlog
 
 try:
     import tests.integration.utils as test_utils
@@ -111,7 +112,7 @@ class BinlogInterruption(unittest.TestCase):
         SINGER_MESSAGES.clear()
 
     def test_table_2_interrupted(self):
-        singer.write_message = singer_write_message_no_table_2
+        singer.write_message = binlog.write_record_message = singer_write_message_no_table_2
 
         state = {}
         failed_syncing_table_2 = False
@@ -153,7 +154,7 @@ class BinlogInterruption(unittest.TestCase):
         self.assertIsNotNone(table_2_bookmark.get('log_pos'))
 
         failed_syncing_table_2 = False
-        singer.write_message = singer_write_message_ok
+        singer.write_message = binlog.write_record_message = singer_write_message_ok
 
         SINGER_MESSAGES.clear()
 
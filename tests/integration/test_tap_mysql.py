@@ -1,3 +1,6 @@
+import decimal
+import io
+import json
 import os
 import unittest
 from unittest.mock import patch
@@ -29,6 +32,10 @@ def accumulate_singer_messages(message):
 
 singer.write_message = accumulate_singer_messages
 
+# binlog records bypass singer.write_message to avoid flushing stdout per row
+WRITE_RECORD_MESSAGE = binlog.write_record_message
+binlog.write_record_message = accumulate_singer_messages
+
 
 class TestTypeMapping(unittest.TestCase):
 
@@ -916,6 +923,26 @@ class TestBinlogReplication(unittest.TestCase):
         self.assertIsNotNone(singer.get_bookmark(self.state, 'tap_mysql_test-binlog_2', 'log_file'))
         self.assertIsNotNone(singer.get_bookmark(self.state, 'tap_mysql_test-binlog_2', 'log_pos'))
 
+    def test_binlog_stream_records_are_written_like_singer(self):
+        global SINGER_MESSAGES
+
+        config = test_utils.get_db_config()
+        config['server_id'] = "100"
+
+        tap_mysql.do_sync(self.conn, config, self.catalog, self.state)
+
+        record_messages = list(filter(lambda m: isinstance(m, singer.RecordMessage), SINGER_MESSAGES))
+        self.assertEqual(10, len(record_messages))
+
+        for record_message in record_messages:
+            stdout = io.TextIOWrapper(io.BytesIO(), encoding='utf-8')
+
+            with patch('tap_mysql.sync_strategies.binlog.sys.stdout', stdout):
+                WRITE_RECORD_MESSAGE(record_message)
+
+            self.assertEqual(json.loads(singer.format_message(record_message), parse_float=decimal.Decimal),
+                             json.loads(stdout.buffer.getvalue(), parse_float=decimal.Decimal))
+
     def test_binlog_stream_with_alteration(self):
         global SINGER_MESSAGES
 
@@ -1,5 +1,9 @@
+import copy
 import datetime
+import decimal
+import io
 import socket
+import threading
 
 import pytz
 import os
@@ -9,7 +13,7 @@ from typing import Dict
 from unittest import TestCase
 from unittest.mock import patch, Mock, call, MagicMock, PropertyMock
 
-from pymysql import InternalError
+from pymysql import InternalError, OperationalError
 from pymysql.cursors import Cursor
 from pymysqlreplication.constants import FIELD_TYPE
 from pymysqlreplication.event import RotateEvent, MariadbGtidEvent, GtidEvent
@@ -213,8 +217,10 @@ class TestBinlogSyncStrategy(TestCase):
             }
         }
 
-        with patch('tap_mysql.sync_strategies.binlog.singer.write_message') as write_msg:
+        with patch('tap_mysql.sync_strategies.binlog.singer.write_message') as write_msg, \
+                patch('tap_mysql.sync_strategies.binlog.write_record_message') as write_record_msg:
             write_msg.side_effect = lambda msg: singer_messages.append(msg)
+            write_record_msg.side_effect = lambda msg: singer_messages.append(msg)
 
             with patch('tap_mysql.sync_strategies.binlog.BinLogStreamReader',
                        autospec=True) as reader_mock:
@@ -813,12 +819,12 @@ class TestBinlogSyncStrategy(TestCase):
                                              'bookmarks': {
                                                  'my_db-stream1': {
                                                      'log_file': 'binlog0003',
-                                                     'log_pos': 999,
+                                                     'log_pos': 1000,
                                                      'version': 1
                                                  },
                                                  'my_db-stream2': {
                                                      'log_file': 'binlog0003',
-                                                     'log_pos': 999,
+                                                     'log_pos': 1000,
                                                      'version': 1
                                                  },
 
@@ -833,6 +839,8 @@ class TestBinlogSyncStrategy(TestCase):
                         'is_mariadb': False,
                         'server_id': 123,
                         'report_slave': socket.gethostname(),
+                        'only_schemas': ['my_db'],
+                        'only_tables': ['stream1', 'stream2'],
                         'only_events': [WriteRowsEvent, UpdateRowsEvent, DeleteRowsEvent, RotateEvent],
                         'log_file': 'binlog0001',
                         'log_pos': 50,
@@ -993,8 +1001,10 @@ class TestBinlogSyncStrategy(TestCase):
             }
         }
 
-        with patch('tap_mysql.sync_strategies.binlog.singer.write_message') as write_msg:
+        with patch('tap_mysql.sync_strategies.binlog.singer.write_message') as write_msg, \
+                patch('tap_mysql.sync_strategies.binlog.write_record_message') as write_record_msg:
             write_msg.side_effect = lambda msg: singer_messages.append(msg)
+            write_record_msg.side_effect = lambda msg: singer_messages.append(msg)
 
             with patch('tap_mysql.sync_strategies.binlog.BinLogStreamReader',
                        autospec=True) as reader_mock:
@@ -1602,13 +1612,13 @@ class TestBinlogSyncStrategy(TestCase):
                                                  'my_db-stream1': {
                                                      'gtid': '0-123-558',
                                                      'log_file': 'binlog0003',
-                                                     'log_pos': 999,
+                                                     'log_pos': 1000,
                                                      'version': 1,
                                                  },
                                                  'my_db-stream2': {
                                                      'gtid': '0-123-558',
                                                      'log_file': 'binlog0003',
-                                                     'log_pos': 999,
+                                                     'log_pos': 1000,
                                                      'version': 1
                                                  },
 
@@ -1623,6 +1633,8 @@ class TestBinlogSyncStrategy(TestCase):
                         'is_mariadb': True,
                         'server_id': 123,
                         'report_slave': socket.gethostname(),
+                        'only_schemas': ['my_db'],
+                        'only_tables': ['stream1', 'stream2'],
                         'only_events': [WriteRowsEvent, UpdateRowsEvent, DeleteRowsEvent, GtidEvent, MariadbGtidEvent],
                         'auto_position': '0-123-555',
                     }
@@ -1899,6 +1911,27 @@ class TestBinlogSyncStrategy(TestCase):
             ]
         )
 
+    @patch('tap_mysql.sync_strategies.binlog.connection.fetch_server_uuid')
+    @patch('tap_mysql.sync_strategies.binlog.connect_with_backoff')
+    def test_fetch_current_gtid_pos_for_mysql_with_given_server(self, connect_with_backoff, fetch_server_uuid):
+
+        mysql_con = MagicMock(spec_set=MySQLConnection).return_value
+        cur_mock = MagicMock(spec_set=Cursor).return_value
+        cur_mock.__enter__.return_value.fetchone.side_effect = [
+            ['3E11FA47-71CA-11E1-9E33-C80AA9429562:1,3E11FA47-71BB-11E1-9E33-C80AA9429562:2:143'],
+        ]
+
+        mysql_con.__enter__.return_value.cursor.return_value = cur_mock
+
+        connect_with_backoff.return_value = mysql_con
+
+        result = binlog.fetch_current_gtid_pos(mysql_con, connection.MYSQL_ENGINE,
+                                               '3E11FA47-71CA-11E1-9E33-C80AA9429562')
+
+        self.assertEqual('3E11FA47-71CA-11E1-9E33-C80AA9429562:1', result)
+
+        fetch_server_uuid.assert_not_called()
+
     @patch('tap_mysql.sync_strategies.binlog.connection.fetch_server_id')
     @patch('tap_mysql.sync_strategies.binlog.connect_with_backoff')
     def test_fetch_current_gtid_pos_for_mariadb_no_gtid_found_expect_exception(
@@ -2005,16 +2038,6 @@ class TestBinlogSyncStrategy(TestCase):
             ['0-4-222'],
             [4]
         ]
-        cur_mock.__enter__.return_value.fetchall.return_value = [
-            ('binlog.030',),
-            ('binlog.031',),
-            ('binlog.032',),
-            ('binlog.033',),
-            ('binlog.034',),
-            ('binlog.040',),
-            ('binlog.041',),
-        ]
-
         mysql_con.__enter__.return_value.cursor.return_value = cur_mock
 
         connect_with_backoff.return_value = mysql_con
@@ -2023,7 +2046,8 @@ class TestBinlogSyncStrategy(TestCase):
 
         cur_mock.__enter__.return_value.execute.assert_has_calls(
             [
-                call('SHOW BINARY LOGS'),
+                call('SHOW BINLOG EVENTS IN %s LIMIT 1', ('binlog.032',)),
+                call('SHOW BINLOG EVENTS IN %s LIMIT 1', ('binlog.040',)),
                 call("select BINLOG_GTID_POS('binlog.032', 14);"),
                 call("SELECT @@server_id"),
             ]
@@ -2054,16 +2078,6 @@ class TestBinlogSyncStrategy(TestCase):
             ['0-4-222,,3-4,5-66-2213,6-89-7222'],
             [89]
         ]
-        cur_mock.__enter__.return_value.fetchall.return_value = [
-            ('binlog.030',),
-            ('binlog.031',),
-            ('binlog.032',),
-            ('binlog.033',),
-            ('binlog.034',),
-            ('binlog.040',),
-            ('binlog.041',),
-        ]
-
         mysql_con.__enter__.return_value.cursor.return_value = cur_mock
 
         connect_with_backoff.return_value = mysql_con
@@ -2072,7 +2086,8 @@ class TestBinlogSyncStrategy(TestCase):
 
         cur_mock.__enter__.return_value.execute.assert_has_calls(
             [
-                call('SHOW BINARY LOGS'),
+                call('SHOW BINLOG EVENTS IN %s LIMIT 1', ('binlog.032',)),
+                call('SHOW BINLOG EVENTS IN %s LIMIT 1', ('binlog.040',)),
                 call("select BINLOG_GTID_POS('binlog.032', 14);"),
                 call("SELECT @@server_id"),
             ]
@@ -2147,3 +2162,520 @@ class TestBinlogSyncStrategy(TestCase):
 
         self.assertEqual("Couldn't find any gtid in state bookmarks to resume logical replication",
                          str(context.exception))
+
+    def test_run_binlog_sync_sends_one_state_message_per_bookmark_period(self):
+        catalog_entry = CatalogEntry(
+            table='stream1',
+            stream='my_db-stream1',
+            tap_stream_id='my_db-stream1',
+            schema=Schema(
+                properties={
+                    'c_int': Schema(inclusion='available', type=['null', 'integer']),
+                }
+            ),
+            metadata=[]
+        )
+
+        binlog_streams_map = {
+            'my_db-stream1': {
+                'catalog_entry': catalog_entry,
+                'desired_columns': {'c_int'}
+            }
+        }
+
+        state = {
+            'bookmarks': {
+                'my_db-stream1': {
+                    'version': 1
+                }
+            }
+        }
+
+        reader = MagicMock()
+        reader.auto_position = None
+
+        def iter_mock(_):
+            for log_file, log_pos, event in [
+                ('binlog0001', 100, get_binlogevent(WriteRowsEvent, {
+                    'schema': 'my_db',
+                    'table': 'stream1',
+                    'columns': [Column('c_int', FIELD_TYPE.INT24)],
+                    'rows': [{'values': {'c_int': i}} for i in range(binlog.UPDATE_BOOKMARK_PERIOD)]
+                })),
+                ('binlog0002', 4, get_binlogevent(RotateEvent, {'next_binlog': 'binlog0002', 'position': 4})),
+                ('binlog0003', 4, get_binlogevent(RotateEvent, {'next_binlog': 'binlog0003', 'position': 4})),
+                ('binlog0003', 200, get_binlogevent(WriteRowsEvent, {
+                    'schema': 'my_db',
+                    'table': 'stream1',
+                    'columns': [Column('c_int', FIELD_TYPE.INT24)],
+                    'rows': [{'values': {'c_int': i}} for i in range(10)]
+                })),
+            ]:
+                reader.log_file = log_file
+                reader.log_pos = log_pos
+                yield event
+
+        reader.__iter__ = iter_mock
+
+        state_messages = []
+
+        with patch('tap_mysql.sync_strategies.binlog.singer.write_message') as write_msg, \
+                patch('tap_mysql.sync_strategies.binlog.write_record_message'):
+            # state messages hold the live state, snapshot them as they are written
+            write_msg.side_effect = lambda msg: isinstance(msg, StateMessage) and state_messages.append(
+                copy.deepcopy(msg))
+
+            binlog._run_binlog_sync(Mock(spec_set=MySQLConnection), reader, binlog_streams_map, state, {},
+                                    'binlog0004', 1000)
+
+        self.assertListEqual(state_messages, [
+            StateMessage(value={
+                'bookmarks': {
+                    'my_db-stream1': {
+                        'log_file': 'binlog0001',
+                        'log_pos': 100,
+                        'version': 1
+                    }
+                }
+            })
+        ])
+
+    def test_generate_streams_map(self):
+        catalog_entry = CatalogEntry(
+            tap_stream_id='my_db-stream1',
+            schema=Schema(
+                properties={
+                    'c_int': Schema(type=['null', 'integer']),
+                    'c_varchar': Schema(type=['null', 'string']),
+                }
+            )
+        )
+
+        streams_map = binlog.generate_streams_map([catalog_entry])
+
+        self.assertDictEqual(streams_map, {
+            'my_db-stream1': {
+                'catalog_entry': catalog_entry,
+                'desired_columns': {'c_int', 'c_varchar', binlog.SDC_DELETED_AT}
+            }
+        })
+
+    def test_handle_delete_rows_event_does_not_modify_event_rows(self):
+        catalog_entry = CatalogEntry(
+            tap_stream_id='my_db-stream1',
+            stream='my_db-stream1',
+            schema=Schema(
+                properties={
+                    'c_int': Schema(type=['null', 'integer']),
+                    binlog.SDC_DELETED_AT: Schema(type=['null', 'string'], format='date-time'),
+                }
+            )
+        )
+
+        event = get_binlogevent(DeleteRowsEvent, {
+            'timestamp': datetime.datetime.timestamp(datetime.datetime(2021, 1, 1, 10, 20, 55, tzinfo=pytz.UTC)),
+            'columns': [Column('c_int', FIELD_TYPE.INT24)],
+            'rows': [{'values': {'c_int': 1}}]
+        })
+
+        state = {'bookmarks': {'my_db-stream1': {'version': 1}}}
+
+        with patch('tap_mysql.sync_strategies.binlog.write_record_message') as write_msg:
+            rows_saved = binlog.handle_delete_rows_event(event,
+                                                         catalog_entry,
+                                                         state,
+                                                         {'c_int', binlog.SDC_DELETED_AT},
+                                                         0,
+                                                         None)
+
+        self.assertEqual(1, rows_saved)
+        self.assertDictEqual({'c_int': 1}, event.rows[0]['values'])
+        self.assertDictEqual({'c_int': 1, binlog.SDC_DELETED_AT: '2021-01-01T10:20:55+00:00'},
+                             write_msg.call_args[0][0].record)
+
+    def test_write_record_message_does_not_flush_stdout(self):
+        record_message = RecordMessage(stream='my_db-stream1', record={'c_int': 1}, version=1)
+
+        with patch('tap_mysql.sync_strategies.binlog.sys.stdout') as stdout_mock:
+            binlog.write_record_message(record_message)
+
+        stdout_mock.buffer.write.assert_called_once_with(
+            b'{"type":"RECORD","stream":"my_db-stream1","record":{"c_int":1},"version":1}\n')
+        stdout_mock.flush.assert_not_called()
+        stdout_mock.buffer.flush.assert_not_called()
+
+    def test_write_record_message_with_decimals(self):
+        record_message = RecordMessage(stream='my_db-stream1', record={'c_decimal': decimal.Decimal('12.30')},
+                                       version=1)
+
+        with patch('tap_mysql.sync_strategies.binlog.sys.stdout') as stdout_mock, \
+                patch('tap_mysql.sync_strategies.binlog.singer.format_message') as format_message:
+            binlog.write_record_message(record_message)
+
+        stdout_mock.buffer.write.assert_called_once_with(
+            b'{"type":"RECORD","stream":"my_db-stream1","record":{"c_decimal":12.30},"version":1}\n')
+        format_message.assert_not_called()
+
+    def test_write_record_message_with_unsupported_values(self):
+        record_message = RecordMessage(stream='my_db-stream1', record={'c_int': 2 ** 70}, version=1)
+
+        with patch('tap_mysql.sync_strategies.binlog.sys.stdout') as stdout_mock:
+            binlog.write_record_message(record_message)
+
+        stdout_mock.buffer.write.assert_called_once_with(
+            b'{"type": "RECORD", "stream": "my_db-stream1", "record": {"c_int": 1180591620717411303424}, '
+            b'"version": 1}\n')
+
+    def test_write_record_message_with_non_ascii_stdout(self):
+        record_message = RecordMessage(stream='my_db-stream1', record={'c_varchar': 'h\u00e9llo'}, version=1)
+        stdout = io.TextIOWrapper(io.BytesIO(), encoding='ascii')
+
+        with patch('tap_mysql.sync_strategies.binlog.sys.stdout', stdout):
+            binlog.write_record_message(record_message)
+
+        self.assertEqual('{"type":"RECORD","stream":"my_db-stream1","record":{"c_varchar":"h\u00e9llo"},'
+                         '"version":1}\n', stdout.buffer.getvalue().decode('utf-8'))
+
+    def test_write_record_message_to_stdout_without_buffer(self):
+        record_message = RecordMessage(stream='my_db-stream1', record={'c_varchar': 'h\u00e9llo'}, version=1)
+        stdout = io.StringIO()
+
+        with patch('tap_mysql.sync_strategies.binlog.sys.stdout', stdout):
+            binlog.write_record_message(record_message)
+
+        self.assertEqual('{"type": "RECORD", "stream": "my_db-stream1", "record": {"c_varchar": "h\\u00e9llo"}, '
+                         '"version": 1}\n', stdout.getvalue())
+
+    def test_read_binlog_in_background_yields_events_in_order_with_positions(self):
+        reader = MagicMock()
+        reader.auto_position = '0-123-1'
+
+        events = [
+            get_binlogevent(WriteRowsEvent, {}),
+            get_binlogevent(MariadbGtidEvent, {'gtid': '0-123-2'}),
+            get_binlogevent(DeleteRowsEvent, {}),
+        ]
+
+        def iter_mock(_):
+            for idx, event in enumerate(events):
+                reader.log_file = 'binlog0001'
+                reader.log_pos = (idx + 1) * 100
+                yield event
+
+        reader.__iter__ = iter_mock
+
+        self.assertListEqual(list(binlog._read_binlog_in_background(reader)), [
+            (events[0], 'binlog0001', 100),
+            (events[1], 'binlog0001', 200),
+            (events[2], 'binlog0001', 300),
+        ])
+        self.assertEqual('0-123-2', reader.auto_position)
+
+    def test_read_binlog_in_background_raises_reader_errors(self):
+        reader = MagicMock()
+
+        def iter_mock(_):
+            reader.log_file = 'binlog0001'
+            reader.log_pos = 100
+            yield get_binlogevent(WriteRowsEvent, {})
+            raise InternalError(1236, 'Could not find first log file name in binary log index file')
+
+        reader.__iter__ = iter_mock
+
+        binlog_events = binlog._read_binlog_in_background(reader)
+        next(binlog_events)
+
+        with self.assertRaises(InternalError):
+            next(binlog_events)
+
+    def test_read_binlog_in_background_stops_reading_when_closed(self):
+        reader = MagicMock()
+        events_read = []
+
+        def iter_mock(_):
+            for idx in range(binlog.BINLOG_EVENTS_QUEUE_SIZE * 10):
+                reader.log_file = 'binlog0001'
+                reader.log_pos = idx
+                events_read.append(idx)
+                yield get_binlogevent(WriteRowsEvent, {})
+
+        reader.__iter__ = iter_mock
+
+        binlog_events = binlog._read_binlog_in_background(reader)
+        next(binlog_events)
+        binlog_events.close()
+
+        # the consumed event, a full queue and the event waiting to be queued at most
+        self.assertLessEqual(len(events_read), binlog.BINLOG_EVENTS_QUEUE_SIZE + 2)
+
+    def test_run_binlog_sync_does_not_wait_for_reader_blocked_after_end_position(self):
+        reader = MagicMock()
+        reader.auto_position = None
+        release_reader = threading.Event()
+
+        def iter_mock(_):
+            reader.log_file = 'binlog0001'
+            reader.log_pos = 2000
+            yield get_binlogevent(RotateEvent, {'next_binlog': 'binlog0001', 'position': 2000})
+
+            # a server not sending EOF leaves the reader waiting for the next event
+            release_reader.wait()
+
+        reader.__iter__ = iter_mock
+
+        state = {'bookmarks': {'my_db-stream1': {'version': 1}}}
+        sync_thread = threading.Thread(target=binlog._run_binlog_sync,
+                                       args=(Mock(spec_set=MySQLConnection), reader, {}, state, {},
+                                             'binlog0001', 1000),
+                                       daemon=True)
+
+        try:
+            sync_thread.start()
+            sync_thread.join(timeout=binlog.BINLOG_READER_JOIN_TIMEOUT + 5)
+
+            self.assertFalse(sync_thread.is_alive())
+        finally:
+            release_reader.set()
+
+    def test_read_binlog_in_background_leaves_reader_to_thread_outliving_join(self):
+        reader = MagicMock()
+        release_reader = threading.Event()
+        reader_closed = threading.Event()
+        closing_threads = []
+
+        def close_mock():
+            closing_threads.append(threading.current_thread())
+            reader_closed.set()
+
+        reader.close.side_effect = close_mock
+
+        def iter_mock(_):
+            reader.log_file = 'binlog0001'
+            reader.log_pos = 100
+            yield get_binlogevent(WriteRowsEvent, {})
+
+            # a server not sending EOF leaves the reader waiting for the next event
+            release_reader.wait()
+
+        reader.__iter__ = iter_mock
+
+        binlog_events = binlog._read_binlog_in_background(reader)
+        next(binlog_events)
+
+        try:
+            with self.assertLogs('tap_mysql', level='WARNING'):
+                binlog_events.close()
+
+            # the reader is still in use by the blocked thread
+            reader.close.assert_not_called()
+        finally:
+            release_reader.set()
+
+        self.assertTrue(reader_closed.wait(timeout=5))
+        self.assertEqual(1, len(closing_threads))
+        self.assertIsNot(threading.current_thread(), closing_threads[0])
+
+    @patch('tap_mysql.sync_strategies.binlog.connect_with_backoff')
+    def test_calculate_bookmark_returns_earliest_log_file(self, connect_with_backoff):
+        binlog_streams = {
+            'stream1': {'schema': {}},
+            'stream2': {'schema': {}},
+            'stream3': {'schema': {}},
+        }
+
+        state = {
+            'bookmarks': {
+                'stream1': {'log_file': 'binlog.040', 'log_pos': 138},
+                'stream2': {'log_file': 'binlog.040', 'log_pos': 50},
+                'stream3': {'log_file': 'binlog.032', 'log_pos': 14},
+            }
+        }
+
+        mysql_con = MagicMock(spec_set=MySQLConnection).return_value
+        cur_mock = MagicMock(spec_set=Cursor).return_value
+        mysql_con.__enter__.return_value.cursor.return_value = cur_mock
+        connect_with_backoff.return_value = mysql_con
+
+        self.assertTupleEqual(('binlog.032', 14), binlog.calculate_bookmark(mysql_con, binlog_streams, state))
+
+        cur_mock.__enter__.return_value.execute.assert_has_calls([
+            call('SHOW BINLOG EVENTS IN %s LIMIT 1', ('binlog.032',)),
+            call('SHOW BINLOG EVENTS IN %s LIMIT 1', ('binlog.040',)),
+        ])
+
+    @patch('tap_mysql.sync_strategies.binlog.connect_with_backoff')
+    def test_calculate_bookmark_fails_if_log_file_expired(self, connect_with_backoff):
+        binlog_streams = {
+            'stream1': {'schema': {}},
+            'stream2': {'schema': {}},
+        }
+
+        state = {
+            'bookmarks': {
+                'stream1': {'log_file': 'binlog.040', 'log_pos': 138},
+                'stream2': {'log_file': 'binlog.032', 'log_pos': 14},
+            }
+        }
+
+        mysql_con = MagicMock(spec_set=MySQLConnection).return_value
+        cur_mock = MagicMock(spec_set=Cursor).return_value
+        cur_mock.__enter__.return_value.execute.side_effect = [
+            OperationalError(1220, 'Error when executing command SHOW BINLOG EVENTS: Could not find target log'),
+            None,
+        ]
+        mysql_con.__enter__.return_value.cursor.return_value = cur_mock
+        connect_with_backoff.return_value = mysql_con
+
+        with self.assertRaises(Exception) as context:
+            binlog.calculate_bookmark(mysql_con, binlog_streams, state)
+
+        self.assertEqual('Unable to replicate binlog stream because the following binary log(s) no longer exist: '
+                         'binlog.032', str(context.exception))
+
+    @patch('tap_mysql.sync_strategies.binlog.connect_with_backoff')
+    def test_calculate_bookmark_fails_if_no_log_file_bookmarked(self, connect_with_backoff):
+        binlog_streams = {
+            'stream1': {'schema': {}},
+        }
+
+        state = {
+            'bookmarks': {
+                'stream1': {'version': 1},
+            }
+        }
+
+        with self.assertRaises(Exception) as context:
+            binlog.calculate_bookmark(Mock(spec_set=MySQLConnection), binlog_streams, state)
+
+        self.assertEqual('Unable to replicate binlog stream because no binary log file and position are bookmarked '
+                         'for the selected streams.', str(context.exception))
+        connect_with_backoff.assert_not_called()
+
+    def test_run_binlog_sync_does_not_resend_state_for_same_position(self):
+        catalog_entry = CatalogEntry(
+            table='stream1',
+            stream='my_db-stream1',
+            tap_stream_id='my_db-stream1',
+            schema=Schema(
+                properties={
+                    'c_int': Schema(inclusion='available', type=['null', 'integer']),
+                }
+            ),
+            metadata=[]
+        )
+
+        binlog_streams_map = {
+            'my_db-stream1': {
+                'catalog_entry': catalog_entry,
+                'desired_columns': {'c_int'}
+            }
+        }
+
+        state = {
+            'bookmarks': {
+                'my_db-stream1': {
+                    'version': 1
+                }
+            }
+        }
+
+        reader = MagicMock()
+        reader.auto_position = None
+
+        def iter_mock(_):
+            # events not updating the reader's position, e.g. without a log_pos in their header
+            for _ in range(2):
+                reader.log_file = 'binlog0001'
+                reader.log_pos = 100
+                yield get_binlogevent(WriteRowsEvent, {
+                    'schema': 'my_db',
+                    'table': 'stream1',
+                    'columns': [Column('c_int', FIELD_TYPE.INT24)],
+                    'rows': [{'values': {'c_int': i}} for i in range(binlog.UPDATE_BOOKMARK_PERIOD)]
+                })
+
+        reader.__iter__ = iter_mock
+
+        state_messages = []
+
+        with patch('tap_mysql.sync_strategies.binlog.singer.write_message') as write_msg, \
+                patch('tap_mysql.sync_strategies.binlog.write_record_message'):
+            write_msg.side_effect = lambda msg: isinstance(msg, StateMessage) and state_messages.append(
+                copy.deepcopy(msg))
+
+            binlog._run_binlog_sync(Mock(spec_set=MySQLConnection), reader, binlog_streams_map, state, {},
+                                    'binlog0004', 1000)
+
+        self.assertEqual(1, len(state_messages))
+
+    def test_run_binlog_sync_bookmarks_end_position_at_eof(self):
+        binlog_streams_map = {
+            'my_db-stream1': {
+                'catalog_entry': CatalogEntry(table='stream1', stream='my_db-stream1', tap_stream_id='my_db-stream1',
+                                              schema=Schema(properties={}), metadata=[]),
+                'desired_columns': set()
+            }
+        }
+
+        state = {'bookmarks': {'my_db-stream1': {'log_file': 'binlog0001', 'log_pos': 100, 'version': 1}}}
+
+        reader = MagicMock()
+        reader.auto_position = None
+
+        # the reader drops the events of unselected tables, none of them reach the sync
+        reader.__iter__.return_value = iter([])
+
+        binlog._run_binlog_sync(Mock(spec_set=MySQLConnection), reader, binlog_streams_map, state, {},
+                                'binlog0004', 1000)
+
+        self.assertDictEqual({'bookmarks': {'my_db-stream1': {'log_file': 'binlog0004', 'log_pos': 1000,
+                                                               'version': 1}}}, state)
+
+    @patch('tap_mysql.sync_strategies.binlog.BinLogStreamReader')
+    @patch('tap_mysql.sync_strategies.binlog.make_connection_wrapper')
+    def test_create_binlog_stream_reader_only_reads_schemas_in_filter_db(self, _, reader_mock):
+        binlog_streams_map = {
+            f'{db}-stream1': {
+                'catalog_entry': CatalogEntry(table='stream1', stream=f'{db}-stream1', tap_stream_id=f'{db}-stream1',
+                                              schema=Schema(properties={}),
+                                              metadata=[{'breadcrumb': [], 'metadata': {'database-name': db}}]),
+                'desired_columns': set()
+            } for db in ('my_db', 'my_db2')
+        }
+
+        config = {'server_id': '123', 'use_gtid': False, 'engine': connection.MYSQL_ENGINE,
+                  'filter_db': 'my_db2,other_db'}
+
+        binlog.create_binlog_stream_reader(config, binlog_streams_map, 'binlog0001', 4, None)
+
+        self.assertListEqual(['my_db2'], reader_mock.call_args[1]['only_schemas'])
+        self.assertListEqual(['stream1'], reader_mock.call_args[1]['only_tables'])
+
+    def test_get_event_columns(self):
+        catalog_entry = CatalogEntry(
+            tap_stream_id='my_db-stream1',
+            schema=Schema(
+                properties={
+                    'c_int': Schema(type=['null', 'integer']),
+                    'c_bool': Schema(type=['null', 'boolean']),
+                    'c_time': Schema(type=['null', 'string'], format='time'),
+                    'c_varchar': Schema(type=['null', 'string']),
+                }
+            )
+        )
+
+        event = get_binlogevent(WriteRowsEvent, {
+            'columns': [
+                Column('c_int', FIELD_TYPE.INT24),
+                Column('c_bool', FIELD_TYPE.BIT),
+                Column('c_time', FIELD_TYPE.TIME2),
+                Column('c_varchar', FIELD_TYPE.VARCHAR),
+                Column('__dropped_col_5__', FIELD_TYPE.BLOB),
+            ]
+        })
+
+        self.assertDictEqual(binlog.get_event_columns(event, catalog_entry, {'c_int', 'c_bool', 'c_time'}), {
+            'c_int': (None, False, FIELD_TYPE.INT24),
+            'c_bool': (None, True, FIELD_TYPE.BIT),
+            'c_time': ('time', False, FIELD_TYPE.TIME2),
+        })
@@ -1,8 +1,10 @@
 import unittest
 
-from singer import CatalogEntry
+from unittest.mock import patch, Mock
+from singer import CatalogEntry, Catalog, Schema
 
-from tap_mysql import binlog_stream_requires_historical
+from tap_mysql import binlog_stream_requires_historical, sync_non_binlog_streams
+from tap_mysql.connection import MySQLConnection, MYSQL_ENGINE
 
 
 class TestTapMysql(unittest.TestCase):
@@ -102,3 +104,39 @@ class TestTapMysql(unittest.TestCase):
             catalog,
             state
         ))
+
+    @patch('tap_mysql.singer.write_message')
+    @patch('tap_mysql.log_engine')
+    @patch('tap_mysql.do_sync_historical_binlog')
+    @patch('tap_mysql.binlog.fetch_gtid_server', return_value='3E11FA47-71CA-11E1-9E33-C80AA9429562')
+    @patch('tap_mysql.binlog.verify_gtid_config')
+    @patch('tap_mysql.binlog.verify_binlog_config')
+    def test_sync_non_binlog_streams_verifies_binlog_config_once(self,
+                                                                 verify_binlog_config,
+                                                                 verify_gtid_config,
+                                                                 fetch_gtid_server,
+                                                                 do_sync_historical_binlog,
+                                                                 *args):
+        catalog = Catalog([
+            CatalogEntry(
+                table=table,
+                stream=f'my_db-{table}',
+                tap_stream_id=f'my_db-{table}',
+                schema=Schema(properties={'c_int': Schema(type=['null', 'integer'])}),
+                metadata=[{'breadcrumb': [], 'metadata': {'database-name': 'my_db',
+                                                          'replication-method': 'LOG_BASED'}}]
+            ) for table in ('stream1', 'stream2')
+        ])
+
+        mysql_conn = Mock(spec_set=MySQLConnection)
+
+        sync_non_binlog_streams(mysql_conn, catalog, {}, True, MYSQL_ENGINE)
+
+        verify_binlog_config.assert_called_once_with(mysql_conn)
+        verify_gtid_config.assert_called_once_with(mysql_conn)
+        fetch_gtid_server.assert_called_once_with(mysql_conn, MYSQL_ENGINE)
+
+        self.assertEqual(2, do_sync_historical_binlog.call_count)
+
+        for sync_call in do_sync_historical_binlog.call_args_list:
+            self.assertEqual('3E11FA47-71CA-11E1-9E33-C80AA9429562', sync_call[0][-1])